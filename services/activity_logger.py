@@ -79,6 +79,23 @@ def log_scan_completed(folder: Path, album_count: int, track_count: int) -> None
     )
 
 
+def log_scan_failed(folder: Path, error: Exception) -> None:
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.exception(
+        "scan_failed",
+        extra={
+            "event": "scan_failed",
+            "details": _sanitize(
+                {
+                    "folder": folder,
+                    "error": str(error),
+                }
+            ),
+            "session_id": get_session_id(),
+        },
+    )
+
+
 def log_album_toggled(album: str, expanded: bool) -> None:
     log_event("album_toggled", album=album, expanded=expanded)
 
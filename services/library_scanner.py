@@ -1,74 +1,82 @@
 """Purpose: Scan music folders and return album-folder data for the application."""
 
 import os
+from collections.abc import Callable
+from operator import itemgetter
 from pathlib import Path
 
 from models import LibraryAlbum, TrackScanMetadata
+from services.library_walker import iter_audio_folders
 
 try:
     from services.tagging.reader import read_canonical_metadata
 except ImportError:  # pragma: no cover - handled at runtime
     read_canonical_metadata = None
 
-AUDIO_EXTS = (".mp3", ".flac", ".wav", ".m4a", ".aac", ".ogg")
 
-
-def scan_music_files(start: Path, root_folder: Path | None = None) -> list[LibraryAlbum]:
-    """Scan a folder recursively and return folders that contain audio files."""
-    albums: list[LibraryAlbum] = []
-
-    for current_root, _, files in os.walk(start):
+def scan_music_files(
+    start: Path,
+    root_folder: Path | None = None,
+    should_cancel: Callable[[], bool] | None = None,
+) -> list[LibraryAlbum]:
+    """Scan a folder recursively and return folders that contain audio files.
+
+    When should_cancel returns True the walk stops and the albums found so far are returned.
+    """
+    # Albums are decorated with their lowercase label as they are built so the
+    # final sort compares precomputed keys without a Python-level key function.
+    keyed_albums: list[tuple[str, LibraryAlbum]] = []
+    start_str = os.fspath(start)
+    # Relative paths are sliced off these prefixes instead of building Path
+    # objects per file, which dominates scan time on large libraries.
+    start_prefix = os.path.join(start_str, "")
+    root_prefix = os.path.join(os.fspath(root_folder), "") if root_folder else None
+    # Album, artist, genre, and date values repeat across every track of an
+    # album, so the scan keeps one shared string per distinct value.
+    string_pool: dict[str, str] = {}
+
+    for current_root, audio_paths in iter_audio_folders(start_str, should_cancel):
         folder_tracks: list[str] = []
         track_metadata: dict[str, TrackScanMetadata] = {}
 
-        for filename in files:
-            if not filename.lower().endswith(AUDIO_EXTS):
-                continue
-
-            full_path = Path(current_root) / filename
-
-            if root_folder and full_path.is_relative_to(root_folder):
-                track_path = full_path.relative_to(root_folder)
-            else:
-                track_path = full_path.relative_to(start)
-
-            folder_tracks.append(str(track_path))
-            track_metadata[str(track_path)] = _build_track_scan_metadata(full_path, track_path)
-
-        if not folder_tracks:
-            continue
+        for full_path in audio_paths:
+            track_path = _relative_path(full_path, start_prefix, root_prefix)
+            folder_tracks.append(track_path)
+            track_metadata[track_path] = _build_track_scan_metadata(full_path, track_path, string_pool)
 
         folder_tracks.sort(key=str.lower)
-        folder_label = _build_folder_label(Path(current_root), start, root_folder)
-        albums.append(
-            LibraryAlbum(
-                folder_path=folder_label,
-                track_count=len(folder_tracks),
-                tracks=folder_tracks,
-                track_metadata=track_metadata,
-            )
+        folder_label = _build_folder_label(current_root, start_prefix, root_prefix)
+        album = LibraryAlbum(
+            folder_path=folder_label,
+            track_count=len(folder_tracks),
+            tracks=folder_tracks,
+            track_metadata=track_metadata,
         )
+        keyed_albums.append((folder_label.lower(), album))
 
-    return sorted(albums, key=lambda album: album.folder_path.lower())
+    keyed_albums.sort(key=itemgetter(0))
+    return [album for _, album in keyed_albums]
 
 
-def _build_folder_label(
-    current_root: Path,
-    start: Path,
-    root_folder: Path | None,
-) -> str:
-    """Return the folder path to show in the UI."""
-    if root_folder and current_root.is_relative_to(root_folder):
-        relative_folder = current_root.relative_to(root_folder)
-    else:
-        relative_folder = current_root.relative_to(start)
+def _relative_path(path: str, start_prefix: str, root_prefix: str | None) -> str:
+    """Return path relative to the library root when possible, otherwise to the scan start."""
+    if root_prefix and path.startswith(root_prefix):
+        return path[len(root_prefix):]
+    if path.startswith(start_prefix):
+        return path[len(start_prefix):]
+    return os.path.relpath(path, start_prefix)
+
 
-    folder_label = str(relative_folder)
-    return folder_label if folder_label != "." else current_root.name
+def _build_folder_label(current_root: str, start_prefix: str, root_prefix: str | None) -> str:
+    """Return the folder path to show in the UI."""
+    folder_label = _relative_path(current_root, start_prefix, root_prefix)
+    if folder_label and folder_label != ".":
+        return folder_label
+    return os.path.basename(os.path.normpath(current_root))
 
 
-def _build_track_scan_metadata(full_path: Path, track_path: Path) -> TrackScanMetadata:
-    metadata = TrackScanMetadata(relative_path=str(track_path), file_name=track_path.name)
+def _build_track_scan_metadata(full_path: str, track_path: str, string_pool: dict[str, str]) -> TrackScanMetadata:
+    metadata = TrackScanMetadata(relative_path=track_path, file_name=os.path.basename(track_path))
     if read_canonical_metadata is None:
         return metadata
 
@@ -78,9 +86,16 @@ def _build_track_scan_metadata(full_path: Path, track_path: Path) -> TrackScanMe
         return metadata
 
     metadata.title = track.metadata.title
-    metadata.artist = list(track.metadata.artist)
-    metadata.album = track.metadata.album
-    metadata.genre = list(track.metadata.genre)
+    metadata.artist = [_pooled(string_pool, value) for value in track.metadata.artist]
+    metadata.album = _pooled(string_pool, track.metadata.album)
+    metadata.genre = [_pooled(string_pool, value) for value in track.metadata.genre]
     metadata.track_number = track.metadata.track_number
-    metadata.release_date = track.metadata.release_date
+    metadata.release_date = _pooled(string_pool, track.metadata.release_date)
     return metadata
+
+
+def _pooled(string_pool: dict[str, str], value: str | None) -> str | None:
+    """Return the pool's copy of value so equal strings share one object."""
+    if value is None:
+        return None
+    return string_pool.setdefault(value, value)
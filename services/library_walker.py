@@ -0,0 +1,57 @@
+"""Purpose: Walk music folders and find the audio files each one contains."""
+
+import os
+from collections.abc import Callable, Iterator
+
+AUDIO_EXTS = (".mp3", ".flac", ".wav", ".m4a", ".aac", ".ogg")
+AUDIO_EXT_SET = frozenset(AUDIO_EXTS)
+# Windows system folders that never hold library audio; dot-folders such as
+# macOS .Spotlight-V100, .Trashes, and .fseventsd are skipped by name prefix.
+SKIPPED_DIR_NAMES = frozenset({"System Volume Information", "$RECYCLE.BIN"})
+
+
+def iter_audio_folders(
+    root: str,
+    should_cancel: Callable[[], bool] | None = None,
+) -> Iterator[tuple[str, list[str]]]:
+    """Yield each folder under root together with the audio file paths it directly contains.
+
+    The walk stops early, before reading the next folder, once should_cancel returns True.
+    """
+    # DirEntry caches the file type from the directory read, so unlike os.walk
+    # this does not need an extra stat() call per entry on most platforms.
+    pending = [root]
+
+    while pending:
+        if should_cancel is not None and should_cancel():
+            return
+
+        current_root = pending.pop()
+        audio_paths: list[str] = []
+
+        try:
+            with os.scandir(current_root) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not is_skipped_dir_name(name):
+                            pending.append(entry.path)
+                    # is_file() follows symlinks, so linked audio files are kept
+                    # while links to folders are neither walked nor listed.
+                    # Only the short suffix is lowercased, not the whole file name.
+                    elif (
+                        (dot := name.rfind(".")) >= 0
+                        and name[dot:].lower() in AUDIO_EXT_SET
+                        and entry.is_file()
+                    ):
+                        audio_paths.append(entry.path)
+        except OSError:
+            continue
+
+        if audio_paths:
+            yield current_root, audio_paths
+
+
+def is_skipped_dir_name(name: str) -> bool:
+    """Return whether a folder is hidden or a system folder the scan should not enter."""
+    return name.startswith(".") or name in SKIPPED_DIR_NAMES
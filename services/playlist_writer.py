@@ -12,38 +12,51 @@ def build_m3u8_lines(
     """Build the text lines that will be written to the playlist file."""
     lines = ["#EXTM3U"]
 
+    # Tracks can be written as-is when there is no base folder or the playlist
+    # is saved into it. resolve() stats every path component, so it runs once
+    # per playlist rather than per track.
+    same_folder = base_folder is None or save_path.parent.resolve() == base_folder.resolve()
+    if same_folder:
+        for track in tracks:
+            lines.extend(("#EXTINF:,", track))
+        return lines
+
+    base_folder_str = os.fspath(base_folder)
+    save_folder_str = os.fspath(save_path.parent.absolute())
     for track in tracks:
-        lines.append("#EXTINF:,")
-        lines.append(_resolve_playlist_entry(track, save_path, base_folder))
+        lines.extend(("#EXTINF:,", _relative_playlist_entry(track, save_folder_str, base_folder_str)))
 
     return lines
 
 
+def build_m3u8_data(
+    tracks: list[str],
+    save_path: Path,
+    base_folder: Path | None = None,
+) -> bytes:
+    """Build the UTF-8 encoded contents of a playlist file."""
+    lines = build_m3u8_lines(tracks, save_path, base_folder)
+    # Encode the whole playlist once so it can be written in a single call.
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
 def write_m3u8_playlist(
     tracks: list[str],
     save_path: Path,
     base_folder: Path | None = None,
 ) -> None:
     """Write a UTF-8 M3U8 playlist to disk."""
-    lines = build_m3u8_lines(tracks, save_path, base_folder)
-    save_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    save_path.write_bytes(build_m3u8_data(tracks, save_path, base_folder))
 
 
-def _resolve_playlist_entry(
+def _relative_playlist_entry(
     track: str,
-    save_path: Path,
-    base_folder: Path | None,
+    save_folder: str,
+    base_folder: str,
 ) -> str:
-    """Return the path entry that should be written for a single track."""
-    if base_folder is None:
-        return track
-
-    if save_path.parent.resolve() == base_folder.resolve():
-        return track
-
-    track_abs = base_folder / track
-
+    """Return a track path relative to the folder the playlist is saved in."""
     try:
-        return os.path.relpath(track_abs, save_path.parent)
+        return os.path.relpath(os.path.join(base_folder, track), save_folder)
     except Exception:
         return track
@@ -3,7 +3,22 @@
 import os
 from pathlib import Path
 
-from PySide6.QtCore import QItemSelectionModel, Qt, QSignalBlocker, QSortFilterProxyModel
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QItemSelectionModel,
+    QModelIndex,
+    QObject,
+    QRegularExpression,
+    QRunnable,
+    Qt,
+    QSignalBlocker,
+    QSortFilterProxyModel,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import QAction, QPixmap, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -18,11 +33,11 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMessageBox,
     QMenu,
     QPlainTextEdit,
+    QProgressBar,
     QPushButton,
     QScrollArea,
     QSplitter,
@@ -56,6 +71,7 @@ from services.activity_logger import (
     log_root_selection_cancelled,
     log_scan_cancelled,
     log_scan_completed,
+    log_scan_failed,
     log_scan_started,
     log_settings_save_failed,
     log_tag_apply_failed,
@@ -70,12 +86,15 @@ from services.activity_logger import (
 )
 from services.app_settings import AppSettings, AppSettingsStore, RenameConfig
 from services.library_scanner import scan_music_files
-from services.playlist_writer import write_m3u8_playlist
+from services.playlist_writer import build_m3u8_data
 from services.tagging import TaggingService
 from services.tagging.reader import read_embedded_cover_art
 
 ALBUM_TRACKS_ROLE = Qt.UserRole + 1
 TRACK_PATH_ROLE = Qt.UserRole + 2
+FILTER_TEXT_ROLE = Qt.UserRole + 3
+LIBRARY_ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+LIBRARY_FILTER_DELAY_MS = 120
 
 
 class TagPreviewDialog(QDialog):
@@ -647,6 +666,130 @@ class AlbumTagPreviewDialog(QDialog):
         return f"{float(score):.4f}" if isinstance(score, (float, int)) else "(missing)"
 
 
+class PlaylistModel(QAbstractListModel):
+    """Expose the playlist state's track paths to a list view."""
+
+    def __init__(self, state: PlaylistState, parent=None) -> None:
+        super().__init__(parent)
+        self._state = state
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._state.playlist_tracks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._state.playlist_tracks):
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._state.playlist_tracks[index.row()]
+        return None
+
+    def flags(self, index):
+        # Only the gaps between rows accept drops, so dragging a track onto
+        # another one reorders the playlist instead of replacing the target.
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child) -> bool:
+        # The playlist view is single-selection, so moves are always one row.
+        if source_parent.isValid() or destination_parent.isValid() or count != 1:
+            return False
+        if not 0 <= source_row < len(self._state.playlist_tracks):
+            return False
+        if not self.beginMoveRows(source_parent, source_row, source_row, destination_parent, destination_child):
+            return False
+
+        new_row = destination_child if destination_child < source_row else destination_child - 1
+        self._state.move_playlist_track(source_row, new_row)
+        self.endMoveRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._state.playlist_tracks):
+            return False
+
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for _ in range(count):
+            self._state.remove_playlist_track(row)
+        self.endRemoveRows()
+        return True
+
+    def append_tracks(self, tracks: list[str]) -> None:
+        """Append tracks to the playlist as one inserted row range."""
+        if not tracks:
+            return
+
+        first_row = len(self._state.playlist_tracks)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(tracks) - 1)
+        self._state.add_tracks_to_playlist(tracks)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._state.clear_playlist()
+        self.endResetModel()
+
+
+class ScanWorker(QObject):
+    """Run one library scan on a background thread and report the result."""
+
+    finished = Signal(list)
+    failed = Signal(str)
+
+    def __init__(self, start: Path, root_folder: Path | None, generation: int) -> None:
+        super().__init__()
+        self.start = start
+        self.root_folder = root_folder
+        self.generation = generation
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            albums = scan_music_files(
+                start=self.start,
+                root_folder=self.root_folder,
+                should_cancel=QThread.currentThread().isInterruptionRequested,
+            )
+        except Exception as exc:
+            log_scan_failed(self.start, exc)
+            self.failed.emit(str(exc))
+            return
+
+        self.finished.emit(albums)
+
+
+class PlaylistWriteSignals(QObject):
+    """Signals a PlaylistWriteTask uses to report back to the GUI thread."""
+
+    finished = Signal()
+    failed = Signal(str)
+
+
+class PlaylistWriteTask(QRunnable):
+    """Write already-encoded playlist data to disk on a thread-pool thread."""
+
+    def __init__(self, playlist_name: str, save_path: Path, tracks: list[str], data: bytes) -> None:
+        super().__init__()
+        self.playlist_name = playlist_name
+        self.save_path = save_path
+        self.tracks = tracks
+        self.data = data
+        self.signals = PlaylistWriteSignals()
+
+    def run(self) -> None:
+        try:
+            self.save_path.write_bytes(self.data)
+        except Exception as exc:
+            log_playlist_save_failed(self.playlist_name, self.save_path, self.tracks, exc)
+            self.signals.failed.emit(str(exc))
+            return
+
+        self.signals.finished.emit()
+
+
 class MainWindow(QWidget):
     """Main application window for browsing music and creating playlists."""
 
@@ -656,6 +799,13 @@ class MainWindow(QWidget):
         self.settings_store = AppSettingsStore()
         self.settings = AppSettings()
         self.tagging_service = TaggingService(acoustid_api_key=os.environ.get("ACOUSTID_API_KEY"))
+        self._scan_thread: QThread | None = None
+        self._scan_worker: ScanWorker | None = None
+        self._scan_show_feedback = False
+        self._pending_scan_feedback: bool | None = None
+        self._scan_generation = 0
+        self._moving_playlist_row = False
+        self._playlist_write_task: PlaylistWriteTask | None = None
 
         self.setWindowTitle("Walkman Playlist Creator")
         self.resize(1000, 600)
@@ -673,17 +823,33 @@ class MainWindow(QWidget):
         self.choose_root_btn = QPushButton("Add Music Location")
         self.remove_location_btn = QPushButton("Remove Selected Location")
         self.scan_btn = QPushButton("Scan Folder")
+        self.scan_progress = QProgressBar()
+        self.scan_progress.setRange(0, 0)
+        self.scan_progress.setTextVisible(False)
+        self.scan_progress.setMaximumWidth(120)
+        self.scan_progress.hide()
 
         self.playlist_search_input = QLineEdit()
         self.playlist_search_input.setPlaceholderText("Filter library for playlist building")
         self.tag_search_input = QLineEdit()
         self.tag_search_input.setPlaceholderText("Filter library for tagging")
-
-        self.playlist_library_model = QStandardItemModel(self)
+        # Typing restarts these timers, so each burst of keystrokes refilters
+        # the library once instead of once per character.
+        self.playlist_filter_timer = QTimer(self)
+        self.playlist_filter_timer.setSingleShot(True)
+        self.playlist_filter_timer.setInterval(LIBRARY_FILTER_DELAY_MS)
+        self.tag_filter_timer = QTimer(self)
+        self.tag_filter_timer.setSingleShot(True)
+        self.tag_filter_timer.setInterval(LIBRARY_FILTER_DELAY_MS)
+
+        # Both library views read the same source model through their own
+        # proxy, so a scan builds the item tree once instead of per tab.
+        self.library_model = QStandardItemModel(self)
         self.playlist_library_proxy = QSortFilterProxyModel(self)
-        self.playlist_library_proxy.setSourceModel(self.playlist_library_model)
-        self.playlist_library_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.playlist_library_proxy.setSourceModel(self.library_model)
+        self.playlist_library_proxy.setFilterCaseSensitivity(Qt.CaseSensitive)
         self.playlist_library_proxy.setFilterKeyColumn(0)
+        self.playlist_library_proxy.setFilterRole(FILTER_TEXT_ROLE)
         self.playlist_library_proxy.setRecursiveFilteringEnabled(True)
 
         self.playlist_library_view = QTreeView()
@@ -693,11 +859,11 @@ class MainWindow(QWidget):
         self.playlist_library_view.setUniformRowHeights(True)
         self.playlist_library_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
-        self.tag_library_model = QStandardItemModel(self)
         self.tag_library_proxy = QSortFilterProxyModel(self)
-        self.tag_library_proxy.setSourceModel(self.tag_library_model)
-        self.tag_library_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.tag_library_proxy.setSourceModel(self.library_model)
+        self.tag_library_proxy.setFilterCaseSensitivity(Qt.CaseSensitive)
         self.tag_library_proxy.setFilterKeyColumn(0)
+        self.tag_library_proxy.setFilterRole(FILTER_TEXT_ROLE)
         self.tag_library_proxy.setRecursiveFilteringEnabled(True)
 
         self.tag_library_view = QTreeView()
@@ -708,10 +874,13 @@ class MainWindow(QWidget):
         self.tag_library_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.tag_library_view.setContextMenuPolicy(Qt.CustomContextMenu)
 
-        self.playlist_widget = QListWidget()
-        self.playlist_widget.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.playlist_widget.setDragDropMode(QAbstractItemView.InternalMove)
-        self.playlist_widget.setDefaultDropAction(Qt.MoveAction)
+        self.playlist_model = PlaylistModel(self.state, self)
+        self.playlist_view = QListView()
+        self.playlist_view.setModel(self.playlist_model)
+        self.playlist_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.playlist_view.setDragDropMode(QAbstractItemView.InternalMove)
+        self.playlist_view.setDefaultDropAction(Qt.MoveAction)
+        self.playlist_view.setUniformItemSizes(True)
 
         self.add_btn = QPushButton("Add ->")
         self.remove_btn = QPushButton("Remove")
@@ -779,6 +948,7 @@ class MainWindow(QWidget):
         top_row.addWidget(self.choose_root_btn)
         top_row.addWidget(self.remove_location_btn)
         top_row.addWidget(self.scan_btn)
+        top_row.addWidget(self.scan_progress)
 
         playlist_left_col = QVBoxLayout()
         playlist_left_col.addWidget(QLabel("Library"))
@@ -796,7 +966,7 @@ class MainWindow(QWidget):
 
         right_col = QVBoxLayout()
         right_col.addWidget(QLabel("Playlist (drag to reorder)"))
-        right_col.addWidget(self.playlist_widget)
+        right_col.addWidget(self.playlist_view)
         right_col.addWidget(self.save_btn)
 
         left_widget = QWidget()
@@ -912,6 +1082,8 @@ class MainWindow(QWidget):
         self.scan_btn.clicked.connect(self.scan_folder)
         self.playlist_search_input.textChanged.connect(self.filter_playlist_library)
         self.tag_search_input.textChanged.connect(self.filter_tag_library)
+        self.playlist_filter_timer.timeout.connect(self._apply_playlist_library_filter)
+        self.tag_filter_timer.timeout.connect(self._apply_tag_library_filter)
         self.playlist_library_view.doubleClicked.connect(self.handle_playlist_library_double_click)
         self.tag_library_view.customContextMenuRequested.connect(self.show_tag_library_context_menu)
         self.tag_library_view.selectionModel().selectionChanged.connect(self.refresh_tag_selection_details)
@@ -926,7 +1098,7 @@ class MainWindow(QWidget):
         self.edit_tag_btn.clicked.connect(self.edit_selected_track_tags)
         self.preview_tag_btn.clicked.connect(self.preview_selected_track_tags)
         self.preview_album_tag_btn.clicked.connect(self.preview_selected_album_tags)
-        self.playlist_widget.model().rowsMoved.connect(self._sync_playlist_from_widget)
+        self.playlist_model.rowsMoved.connect(self._log_playlist_drag_reorder)
         self.save_rename_settings_btn.clicked.connect(self.save_rename_settings)
         self.reset_rename_defaults_btn.clicked.connect(self.reset_rename_settings_defaults)
         self.rename_enabled_checkbox.toggled.connect(self._refresh_rename_settings_preview)
@@ -1044,6 +1216,7 @@ class MainWindow(QWidget):
         next_folder = self.state.music_directories[0] if self.state.music_directories else None
         self.state.set_root_folder(next_folder)
         if next_folder is None:
+            self._cancel_scan()
             self.state.clear_library()
             self.populate_library()
 
@@ -1076,6 +1249,12 @@ class MainWindow(QWidget):
         self.scan_folder(show_feedback=False)
 
     def scan_folder(self, *, show_feedback: bool = True) -> None:
+        if self._scan_thread is not None:
+            # Rescan once the running scan finishes so the library reflects the
+            # latest location and any files that were just tagged or renamed.
+            self._pending_scan_feedback = bool(self._pending_scan_feedback) or show_feedback
+            return
+
         start = self.state.root_folder
 
         if start is None:
@@ -1095,8 +1274,28 @@ class MainWindow(QWidget):
             self._update_root_label()
 
         log_scan_started(start, self.state.root_folder)
-        albums = scan_music_files(start=start, root_folder=self.state.root_folder)
-        base_folder = self.state.root_folder or start
+        self._scan_generation += 1
+        self._scan_show_feedback = show_feedback
+        self._scan_worker = ScanWorker(start, self.state.root_folder, self._scan_generation)
+        self._scan_thread = QThread(self)
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_worker.finished.connect(self._on_scan_done)
+        self._scan_worker.failed.connect(self._on_scan_failed)
+
+        self.scan_btn.setEnabled(False)
+        self.scan_progress.show()
+        self._scan_thread.start()
+
+    def _on_scan_done(self, albums: list[LibraryAlbum]) -> None:
+        worker = self._scan_worker
+        start = worker.start
+        base_folder = worker.root_folder or start
+        show_feedback = self._scan_show_feedback
+        self._finish_scan()
+
+        if self._start_pending_scan() or not self._is_current_scan(worker):
+            return
 
         self.state.set_library(albums, base_folder)
         self.populate_library()
@@ -1116,66 +1315,145 @@ class MainWindow(QWidget):
                 ),
             )
 
+    def _on_scan_failed(self, message: str) -> None:
+        worker = self._scan_worker
+        self._finish_scan()
+
+        if self._start_pending_scan() or not self._is_current_scan(worker):
+            return
+
+        QMessageBox.critical(self, "Scan failed", f"Could not scan folder: {message}")
+
+    def _finish_scan(self) -> None:
+        """Stop the scan thread and restore the scan controls."""
+        self._scan_thread.quit()
+        self._scan_thread.wait()
+        self._scan_worker.deleteLater()
+        self._scan_thread.deleteLater()
+        self._scan_worker = None
+        self._scan_thread = None
+
+        self.scan_progress.hide()
+        self.scan_btn.setEnabled(True)
+
+    def _start_pending_scan(self) -> bool:
+        """Start a scan that was requested while another one was running."""
+        if self._pending_scan_feedback is None:
+            return False
+
+        show_feedback = self._pending_scan_feedback
+        self._pending_scan_feedback = None
+        if self.state.root_folder is None:
+            # The location was removed meanwhile; do not prompt for a new folder.
+            return False
+
+        self.scan_folder(show_feedback=show_feedback)
+        return True
+
+    def _is_current_scan(self, worker: ScanWorker) -> bool:
+        """Return whether a finished scan still matches the active music location."""
+        return worker.generation == self._scan_generation and worker.root_folder == self.state.root_folder
+
+    def _cancel_scan(self) -> None:
+        """Drop any running or queued scan so its result is never applied."""
+        self._scan_generation += 1
+        self._pending_scan_feedback = None
+        if self._scan_thread is not None:
+            self._scan_thread.requestInterruption()
+
+    def closeEvent(self, event) -> None:
+        if self._scan_thread is not None:
+            # The walk checks for interruption between folders, so this only
+            # waits for the folder currently being read.
+            self._cancel_scan()
+            self._scan_thread.quit()
+            self._scan_thread.wait()
+        super().closeEvent(event)
+
     def populate_library(self) -> None:
-        self.playlist_library_model.clear()
-        self.tag_library_model.clear()
+        items = [self._build_library_item(album) for album in self.state.library_albums]
 
-        for album in self.state.library_albums:
-            playlist_item = self._build_library_item(album)
-            playlist_item.setEditable(False)
-            self.playlist_library_model.appendRow(playlist_item)
-
-            tag_item = self._build_library_item(album)
-            tag_item.setEditable(False)
-            self.tag_library_model.appendRow(tag_item)
-
-        self.filter_playlist_library(self.playlist_search_input.text())
-        self.filter_tag_library(self.tag_search_input.text())
-        self.playlist_library_view.collapseAll()
-        self.tag_library_view.collapseAll()
+        # Insert every album in one appendRows call so the proxies and views
+        # handle a single row-range insert instead of one per album.
+        self.playlist_library_view.setUpdatesEnabled(False)
+        self.tag_library_view.setUpdatesEnabled(False)
+        try:
+            self.library_model.clear()
+            self.library_model.invisibleRootItem().appendRows(items)
+        finally:
+            self.playlist_library_view.setUpdatesEnabled(True)
+            self.tag_library_view.setUpdatesEnabled(True)
+
+        # The proxies refilter new rows on their own; only the expansion state
+        # needs to follow the active query again.
+        self._update_library_expansion(self.playlist_library_view, self.playlist_search_input.text().strip())
+        self._update_library_expansion(self.tag_library_view, self.tag_search_input.text().strip())
         self.refresh_tag_selection_details()
 
     def filter_playlist_library(self, text: str) -> None:
-        self._filter_library_view(self.playlist_library_proxy, self.playlist_library_view, text)
+        self.playlist_filter_timer.start()
 
     def filter_tag_library(self, text: str) -> None:
-        self._filter_library_view(self.tag_library_proxy, self.tag_library_view, text)
+        self.tag_filter_timer.start()
+
+    def _apply_playlist_library_filter(self) -> None:
+        self._filter_library_view(
+            self.playlist_library_proxy,
+            self.playlist_library_view,
+            self.playlist_search_input.text(),
+        )
+
+    def _apply_tag_library_filter(self) -> None:
+        self._filter_library_view(
+            self.tag_library_proxy,
+            self.tag_library_view,
+            self.tag_search_input.text(),
+        )
 
     @staticmethod
     def _filter_library_view(proxy, view, text: str) -> None:
-        proxy.setFilterFixedString(text.strip())
-        if text.strip():
+        # Rows carry their case-folded text in FILTER_TEXT_ROLE, so folding the
+        # query once lets the proxy match case-sensitively without folding
+        # every row's text again on each refilter.
+        query = text.strip().casefold()
+        # Leading/trailing whitespace and case changes leave the query as is,
+        # so skip the refilter and the full expand/collapse pass it would cost.
+        if QRegularExpression.escape(query) == proxy.filterRegularExpression().pattern():
+            return
+
+        proxy.setFilterFixedString(query)
+        MainWindow._update_library_expansion(view, query)
+
+    @staticmethod
+    def _update_library_expansion(view, query: str) -> None:
+        if query:
             view.expandAll()
         else:
             view.collapseAll()
 
     def get_selected_library_tracks(self) -> list[str]:
-        indexes = self.playlist_library_view.selectionModel().selectedIndexes()
+        # Proxy indexes forward data() to the source model, so there is no need
+        # to map each selected row back to its QStandardItem.
         tracks: list[str] = []
 
-        for proxy_index in indexes:
-            source_index = self.playlist_library_proxy.mapToSource(proxy_index)
-            item = self.playlist_library_model.itemFromIndex(source_index)
-            if item is not None:
-                tracks.extend(item.data(ALBUM_TRACKS_ROLE) or [])
+        for proxy_index in self.playlist_library_view.selectionModel().selectedRows():
+            tracks.extend(proxy_index.data(ALBUM_TRACKS_ROLE) or [])
 
         return tracks
 
     def handle_playlist_library_double_click(self, proxy_index) -> None:
-        source_index = self.playlist_library_proxy.mapToSource(proxy_index)
-        item = self.playlist_library_model.itemFromIndex(source_index)
-
-        if item is None:
+        if not proxy_index.isValid():
             return
 
-        if item.hasChildren():
+        # Only track rows carry a track path; album rows toggle instead.
+        if proxy_index.data(TRACK_PATH_ROLE) is None:
             expanded = not self.playlist_library_view.isExpanded(proxy_index)
             self.playlist_library_view.setExpanded(proxy_index, expanded)
-            log_album_toggled(item.text(), expanded)
+            log_album_toggled(proxy_index.data(), expanded)
             return
 
         self.add_tracks_to_playlist(
-            item.data(ALBUM_TRACKS_ROLE) or [],
+            proxy_index.data(ALBUM_TRACKS_ROLE) or [],
             source="library_double_click",
         )
 
@@ -1185,7 +1463,7 @@ class MainWindow(QWidget):
             return
 
         source_index = self.tag_library_proxy.mapToSource(proxy_index)
-        item = self.tag_library_model.itemFromIndex(source_index)
+        item = self.library_model.itemFromIndex(source_index)
         if item is None:
             return
 
@@ -1290,7 +1568,7 @@ class MainWindow(QWidget):
             return None
 
         source_index = self.tag_library_proxy.mapToSource(indexes[0])
-        item = self.tag_library_model.itemFromIndex(source_index)
+        item = self.library_model.itemFromIndex(source_index)
         if item is None:
             return None
 
@@ -1729,57 +2007,46 @@ class MainWindow(QWidget):
         if not tracks:
             return
 
-        self.state.add_tracks_to_playlist(tracks)
+        self.playlist_model.append_tracks(tracks)
         log_tracks_added(tracks, source)
-        self.populate_playlist()
-        self.playlist_widget.setCurrentRow(self.playlist_widget.count() - 1)
-
-    def populate_playlist(self) -> None:
-        self.playlist_widget.clear()
-
-        for track in self.state.playlist_tracks:
-            self.playlist_widget.addItem(QListWidgetItem(track))
+        self._set_current_playlist_row(self.playlist_model.rowCount() - 1)
 
     def remove_selected_from_playlist(self) -> None:
-        row = self.playlist_widget.currentRow()
+        row = self._current_playlist_row()
         if row < 0:
             return
 
         removed_track = self.state.playlist_tracks[row]
-        self.state.remove_playlist_track(row)
+        self.playlist_model.removeRow(row)
         log_playlist_track_removed(removed_track, row)
-        self.populate_playlist()
 
-        if self.playlist_widget.count() > 0:
-            self.playlist_widget.setCurrentRow(min(row, self.playlist_widget.count() - 1))
+        if self.playlist_model.rowCount() > 0:
+            self._set_current_playlist_row(min(row, self.playlist_model.rowCount() - 1))
 
     def move_up(self) -> None:
-        row = self.playlist_widget.currentRow()
+        row = self._current_playlist_row()
         if row <= 0:
             return
 
         track = self.state.playlist_tracks[row]
-        self.state.move_playlist_track(row, row - 1)
+        self._move_playlist_row(row, row - 1)
         log_playlist_reordered(track, row, row - 1, "move_up_button")
-        self.populate_playlist()
-        self.playlist_widget.setCurrentRow(row - 1)
+        self._set_current_playlist_row(row - 1)
 
     def move_down(self) -> None:
-        row = self.playlist_widget.currentRow()
-        if row < 0 or row >= self.playlist_widget.count() - 1:
+        row = self._current_playlist_row()
+        if row < 0 or row >= self.playlist_model.rowCount() - 1:
             return
 
         track = self.state.playlist_tracks[row]
-        self.state.move_playlist_track(row, row + 1)
+        self._move_playlist_row(row, row + 1)
         log_playlist_reordered(track, row, row + 1, "move_down_button")
-        self.populate_playlist()
-        self.playlist_widget.setCurrentRow(row + 1)
+        self._set_current_playlist_row(row + 1)
 
     def clear_playlist(self) -> None:
         cleared_count = len(self.state.playlist_tracks)
-        self.state.clear_playlist()
+        self.playlist_model.clear()
         log_playlist_cleared(cleared_count)
-        self.populate_playlist()
 
     def save_playlist(self) -> None:
         if not self.state.playlist_tracks:
@@ -1809,50 +2076,92 @@ class MainWindow(QWidget):
             return
 
         save_path = Path(file_path)
-        log_playlist_save_started(playlist_name, save_path, self.state.playlist_tracks)
+        tracks = list(self.state.playlist_tracks)
+        log_playlist_save_started(playlist_name, save_path, tracks)
 
+        # Building the playlist text is cheap and stays here so path errors are
+        # reported right away; only the file write, which can be slow on a
+        # mounted Walkman, moves to the thread pool.
         try:
-            write_m3u8_playlist(
-                tracks=self.state.playlist_tracks,
+            data = build_m3u8_data(
+                tracks=tracks,
                 save_path=save_path,
                 base_folder=self.state.library_base_folder,
             )
         except Exception as exc:
-            log_playlist_save_failed(
-                playlist_name,
-                save_path,
-                self.state.playlist_tracks,
-                exc,
-            )
+            log_playlist_save_failed(playlist_name, save_path, tracks, exc)
             QMessageBox.critical(self, "Save failed", f"Could not save playlist: {exc}")
             return
 
-        log_playlist_saved(playlist_name, save_path, self.state.playlist_tracks)
-        QMessageBox.information(self, "Saved", f"Playlist saved to {file_path}")
+        self._playlist_write_task = PlaylistWriteTask(playlist_name, save_path, tracks, data)
+        self._playlist_write_task.signals.finished.connect(self._on_playlist_saved)
+        self._playlist_write_task.signals.failed.connect(self._on_playlist_save_failed)
+        self.save_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(self._playlist_write_task)
+
+    def _on_playlist_saved(self) -> None:
+        task = self._finish_playlist_write()
+        log_playlist_saved(task.playlist_name, task.save_path, task.tracks)
+        QMessageBox.information(self, "Saved", f"Playlist saved to {task.save_path}")
+
+    def _on_playlist_save_failed(self, message: str) -> None:
+        self._finish_playlist_write()
+        QMessageBox.critical(self, "Save failed", f"Could not save playlist: {message}")
+
+    def _finish_playlist_write(self) -> PlaylistWriteTask:
+        """Release the finished write task and re-enable saving."""
+        task = self._playlist_write_task
+        self._playlist_write_task = None
+        self.save_btn.setEnabled(True)
+        return task
+
+    def _current_playlist_row(self) -> int:
+        index = self.playlist_view.currentIndex()
+        return index.row() if index.isValid() else -1
+
+    def _set_current_playlist_row(self, row: int) -> None:
+        self.playlist_view.setCurrentIndex(self.playlist_model.index(row))
+
+    def _move_playlist_row(self, row: int, new_row: int) -> None:
+        """Move one playlist row through the model so the view updates in place."""
+        # moveRow takes the destination as the row to insert before, counted
+        # before the source row is removed.
+        destination = new_row if new_row < row else new_row + 1
+        self._moving_playlist_row = True
+        try:
+            self.playlist_model.moveRow(QModelIndex(), row, QModelIndex(), destination)
+        finally:
+            self._moving_playlist_row = False
 
-    def _sync_playlist_from_widget(self, *args) -> None:
-        # Drag-and-drop reorders the widget directly, so we copy that order back
-        # into the state to keep the UI and business data aligned.
-        self.state.playlist_tracks = [
-            self.playlist_widget.item(index).text()
-            for index in range(self.playlist_widget.count())
-        ]
+    def _log_playlist_drag_reorder(self, *args) -> None:
+        if self._moving_playlist_row:
+            # Button moves log their own reorder event with the source button.
+            return
+
+        # Drag-and-drop moves rows through PlaylistModel.moveRows, which
+        # already updated the state, so only the new order is logged here.
         log_playlist_reordered_from_drag(self.state.playlist_tracks)
 
     def _build_library_item(self, album: LibraryAlbum) -> QStandardItem:
         """Create one library row that displays a folder and stores its tracks."""
         item = QStandardItem(album.display_name)
+        item.setFlags(LIBRARY_ITEM_FLAGS)
         item.setData(album.tracks, ALBUM_TRACKS_ROLE)
+        item.setData(album.display_name.casefold(), FILTER_TEXT_ROLE)
 
+        child_items: list[QStandardItem] = []
         for track in album.tracks:
             track_metadata = album.track_metadata.get(track)
-            child_item = QStandardItem(track_metadata.display_name if track_metadata else Path(track).name)
-            child_item.setEditable(False)
+            display_name = track_metadata.display_name if track_metadata else Path(track).name
+            child_item = QStandardItem(display_name)
+            child_item.setFlags(LIBRARY_ITEM_FLAGS)
+            child_item.setData(display_name.casefold(), FILTER_TEXT_ROLE)
             child_item.setData([track], ALBUM_TRACKS_ROLE)
             child_item.setData(track, TRACK_PATH_ROLE)
             child_item.setToolTip(track_metadata.tooltip_text if track_metadata else track)
-            item.appendRow(child_item)
+            child_items.append(child_item)
 
+        item.appendRows(child_items)
         return item
 
     def get_selected_single_track_path(self) -> str | None:
@@ -1862,7 +2171,7 @@ class MainWindow(QWidget):
 
         for proxy_index in indexes:
             source_index = self.tag_library_proxy.mapToSource(proxy_index)
-            item = self.tag_library_model.itemFromIndex(source_index)
+            item = self.library_model.itemFromIndex(source_index)
             if item is None or item.hasChildren():
                 continue
 
@@ -1882,7 +2191,7 @@ class MainWindow(QWidget):
             return None
 
         source_index = self.tag_library_proxy.mapToSource(indexes[0])
-        item = self.tag_library_model.itemFromIndex(source_index)
+        item = self.library_model.itemFromIndex(source_index)
         if item is None or not item.hasChildren():
             return None
 